@@ -4,63 +4,112 @@ CORS, authentication, and request logging
 """
 import time
 import logging
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi import status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 
 from backend.config import settings
+from backend.api.routes import get_health_status
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Middleware to log all incoming requests"""
     
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        
-        # Log request
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Client: {request.client.host if request.client else 'Unknown'}"
-        )
-        
-        # Process request
-        response = await call_next(request)
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Calculate process time
-        process_time = time.time() - start_time
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
         
-        # Log response
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
-        )
+        # Log request
+        if logger.isEnabledFor(logging.INFO):
+            client = scope.get("client")
+            logger.info(
+                "%s %s - Client: %s",
+                method, path, client[0] if client else "Unknown"
+            )
         
-        # Add process time to response headers
-        response.headers["X-Process-Time"] = str(process_time)
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Calculate process time
+                process_time = time.perf_counter() - start_time
+                
+                # Log response
+                logger.info(
+                    "%s %s - Status: %s - Time: %.3fs",
+                    method, path, message["status"], process_time
+                )
+                
+                # Add process time to response headers
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{process_time:.3f}")
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Middleware to handle and format errors"""
     
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
-            return JSONResponse(
+            # Headers already went out, nothing sensible left to send
+            if response_started:
+                raise
+            response = ORJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": "Internal server error",
                     "message": str(e) if settings.debug else "An error occurred"
                 }
             )
+            await response(scope, receive, send)
+
+
+class HealthShortcutMiddleware:
+    """Answer GET health checks without entering the router"""
+    
+    def __init__(self, app, path: str, get_payload):
+        self.app = app
+        self.path = path
+        self.get_payload = get_payload
+    
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] == "http"
+                and scope["path"] == self.path
+                and scope["method"] == "GET"):
+            response = ORJSONResponse(content=self.get_payload())
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
 
 
 def setup_cors(app):
@@ -71,11 +120,18 @@ def setup_cors(app):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        max_age=settings.cors_max_age,
     )
 
 
 def setup_middleware(app):
     """Setup all middleware"""
+    # Added first so it sits inside CORS but ahead of the router
+    app.add_middleware(
+        HealthShortcutMiddleware,
+        path=f"{settings.api_prefix}/health",
+        get_payload=get_health_status
+    )
     setup_cors(app)
     app.add_middleware(ErrorHandlingMiddleware)
     
@@ -2,22 +2,37 @@
 API Routes
 Main API endpoints
 """
+import hashlib
+import time
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from pymongo.database import Database
-from typing import Union
+from typing import Optional, Tuple, Union
 from pydantic import BaseModel, EmailStr
 
-from backend.database import get_database, db_engine
-from backend.database.connection import DatabaseType
-from backend.database.models import User, Base
+from backend.app_config import get_app_info, get_app_mode
+from backend.database import get_database, db_backend
 from backend.services.auth import AuthService
 from backend.config import settings
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.api_prefix}/auth/login")
 
+# Recent successful password checks. Keying on the stored hash is only safe
+# because the hash embeds its salt and is stable until the password changes,
+# at which point the old key simply stops matching.
+_verify_cache = TTLCache(maxsize=1024, ttl=10)
+
+# Last database probe for /health as (monotonic time, status)
+_DB_STATUS_TTL = 2.0
+_db_status_cache: Tuple[float, str] = (0.0, "")
+
+# app_config.json does not change at runtime
+_APP_INFO = get_app_info()
+_APP_MODE = get_app_mode()
+
 
 # Pydantic models for request/response
 class UserCreate(BaseModel):
@@ -28,10 +43,10 @@ class UserCreate(BaseModel):
 
 
 class UserResponse(BaseModel):
-    id: int
+    id: Union[int, str]
     email: str
     username: str
-    full_name: str = None
+    full_name: Optional[str] = None
     is_active: bool
     
     class Config:
@@ -52,6 +67,55 @@ class HealthResponse(BaseModel):
     mode: str = None
 
 
+async def _verify_password_cached(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password, skipping the KDF for a recent identical success"""
+    # Debug runs always pay the full hash so login behaves as it would uncached
+    if settings.debug:
+        return await AuthService.averify_password(plain_password, hashed_password)
+    
+    key = hashlib.sha256(plain_password.encode() + hashed_password.encode()).digest()
+    if key in _verify_cache:
+        return True
+    
+    verified = await AuthService.averify_password(plain_password, hashed_password)
+    # Failures are never cached so every wrong guess pays the full hash cost
+    if verified:
+        _verify_cache[key] = True
+    return verified
+
+
+def _get_db_status() -> str:
+    """Get database status, probing at most once every _DB_STATUS_TTL seconds"""
+    global _db_status_cache
+    
+    checked_at, db_status = _db_status_cache
+    now = time.monotonic()
+    if db_status and now - checked_at < _DB_STATUS_TTL:
+        return db_status
+    
+    try:
+        # Test database connection
+        db_backend.ping()
+        db_status = "connected"
+    except Exception as e:
+        db_status = f"error: {str(e)}"
+    
+    _db_status_cache = (now, db_status)
+    return db_status
+
+
+def get_health_status() -> dict:
+    """Health payload shared by the /health route and HealthShortcutMiddleware"""
+    return {
+        "status": "healthy",
+        "environment": settings.environment,
+        "database": _get_db_status(),
+        "app_name": _APP_INFO.get("name"),
+        "app_version": _APP_INFO.get("version"),
+        "mode": _APP_MODE
+    }
+
+
 # Dependency to get current user
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -64,6 +128,10 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # A JWT is always header.payload.signature; reject anything else before any crypto
+    if token.count(".") != 2:
+        raise credentials_exception
+    
     payload = AuthService.decode_access_token(token)
     if payload is None:
         raise credentials_exception
@@ -73,67 +141,24 @@ async def get_current_user(
         raise credentials_exception
     
     # Get user from database
-    from pymongo.database import Database as MongoDatabase
-    
-    if isinstance(db, Session) and User is not None:
-        # SQL database
-        user = db.query(User).filter(User.username == username).first()
-        if user is None:
-            raise credentials_exception
-        return {
-            "id": user.id,
-            "username": user.username,
-            "email": user.email,
-            "is_active": user.is_active
-        }
-    elif isinstance(db, MongoDatabase):
-        # MongoDB
-        user = db.users.find_one({"username": username})
-        if user is None:
-            raise credentials_exception
-        return {
-            "id": str(user["_id"]),
-            "username": user["username"],
-            "email": user["email"],
-            "is_active": user.get("is_active", True)
-        }
-    else:
+    user = db_backend.get_user_by_username(db, username)
+    if user is None:
         raise credentials_exception
+    return {
+        "id": user["id"],
+        "username": user["username"],
+        "email": user["email"],
+        "is_active": user["is_active"]
+    }
 
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint"""
-    from backend.app_config import get_app_info, get_app_mode
-    
-    try:
-        # Test database connection
-        from pymongo.database import Database as MongoDatabase
-        
-        if isinstance(db_engine, MongoDatabase):
-            # MongoDB
-            db_engine.command("ping")
-            db_status = "connected"
-        else:
-            # SQL database
-            from sqlalchemy import text
-            with db_engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            db_status = "connected"
-    except Exception as e:
-        db_status = f"error: {str(e)}"
-    
-    app_info = get_app_info()
-    app_mode = get_app_mode()
-    
-    return HealthResponse(
-        status="healthy",
-        environment=settings.environment,
-        database=db_status,
-        app_name=app_info.get("name"),
-        app_version=app_info.get("version"),
-        mode=app_mode
-    )
+    """
+    Health check endpoint
+    GET requests are normally answered by HealthShortcutMiddleware before reaching here
+    """
+    return HealthResponse(**get_health_status())
 
 
 @router.post("/auth/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -142,77 +167,24 @@ async def register(
     db: Union[Session, Database] = Depends(get_database)
 ):
     """Register a new user"""
-    auth_service = AuthService()
-    
     # Check if user exists
-    from pymongo.database import Database as MongoDatabase
-    
-    if isinstance(db, Session) and User is not None:
-        # SQL database
-        existing_user = db.query(User).filter(
-            (User.email == user_data.email) | (User.username == user_data.username)
-        ).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email or username already registered"
-            )
-        
-        # Create new user
-        hashed_password = auth_service.get_password_hash(user_data.password)
-        new_user = User(
-            email=user_data.email,
-            username=user_data.username,
-            hashed_password=hashed_password,
-            full_name=user_data.full_name
-        )
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-        
-        return UserResponse(
-            id=new_user.id,
-            email=new_user.email,
-            username=new_user.username,
-            full_name=new_user.full_name,
-            is_active=new_user.is_active
-        )
-    elif isinstance(db, MongoDatabase):
-        # MongoDB
-        existing_user = db.users.find_one({
-            "$or": [
-                {"email": user_data.email},
-                {"username": user_data.username}
-            ]
-        })
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email or username already registered"
-            )
-        
-        # Create new user
-        from datetime import datetime
-        hashed_password = auth_service.get_password_hash(user_data.password)
-        user_doc = {
-            "email": user_data.email,
-            "username": user_data.username,
-            "hashed_password": hashed_password,
-            "full_name": user_data.full_name,
-            "is_active": True,
-            "is_superuser": False,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        }
-        result = db.users.insert_one(user_doc)
-        
-        return UserResponse(
-            id=str(result.inserted_id),
-            email=user_doc["email"],
-            username=user_doc["username"],
-            full_name=user_doc["full_name"],
-            is_active=user_doc["is_active"]
+    if db_backend.user_exists(db, user_data.email, user_data.username):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email or username already registered"
         )
+    
+    # Create new user
+    hashed_password = await AuthService.aget_password_hash(user_data.password)
+    new_user = db_backend.create_user(
+        db,
+        email=user_data.email,
+        username=user_data.username,
+        hashed_password=hashed_password,
+        full_name=user_data.full_name
+    )
+    
+    return UserResponse.model_validate(new_user)
 
 
 @router.post("/auth/login", response_model=Token)
@@ -221,49 +193,23 @@ async def login(
     db: Union[Session, Database] = Depends(get_database)
 ):
     """Login and get access token"""
-    auth_service = AuthService()
-    
     # Get user from database
-    from pymongo.database import Database as MongoDatabase
+    user = db_backend.get_user_by_username(db, form_data.username)
+    if not user or not await _verify_password_cached(form_data.password, user["hashed_password"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    if isinstance(db, Session) and User is not None:
-        # SQL database
-        user = db.query(User).filter(User.username == form_data.username).first()
-        if not user or not auth_service.verify_password(form_data.password, user.hashed_password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect username or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User account is inactive"
-            )
-    elif isinstance(db, MongoDatabase):
-        # MongoDB
-        user = db.users.find_one({"username": form_data.username})
-        if not user or not auth_service.verify_password(form_data.password, user["hashed_password"]):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect username or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        if not user.get("is_active", True):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User account is inactive"
-            )
-    else:
+    if not user["is_active"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database configuration error"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
         )
     
     # Create access token
-    access_token = auth_service.create_access_token(data={"sub": form_data.username})
+    access_token = AuthService.create_access_token(data={"sub": form_data.username})
     
     return Token(access_token=access_token, token_type="bearer")
 
@@ -282,34 +228,5 @@ async def get_users(
     db: Union[Session, Database] = Depends(get_database)
 ):
     """Get list of users (requires authentication)"""
-    from pymongo.database import Database as MongoDatabase
-    
-    if isinstance(db, Session) and User is not None:
-        # SQL database
-        users = db.query(User).offset(skip).limit(limit).all()
-        return [
-            UserResponse(
-                id=user.id,
-                email=user.email,
-                username=user.username,
-                full_name=user.full_name,
-                is_active=user.is_active
-            )
-            for user in users
-        ]
-    elif isinstance(db, MongoDatabase):
-        # MongoDB
-        users = list(db.users.find().skip(skip).limit(limit))
-        return [
-            UserResponse(
-                id=str(user["_id"]),
-                email=user["email"],
-                username=user["username"],
-                full_name=user.get("full_name"),
-                is_active=user.get("is_active", True)
-            )
-            for user in users
-        ]
-    else:
-        return []
-
+    # Plain dicts: response_model validates and serializes them once
+    return db_backend.list_users(db, skip, limit)
@@ -3,6 +3,7 @@ Application Configuration Loader
 Loads configuration from app_config.json
 """
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -10,8 +11,12 @@ PROJECT_ROOT = Path(__file__).parent.parent
 CONFIG_FILE = PROJECT_ROOT / "app_config.json"
 
 
+@lru_cache(maxsize=1)
 def load_app_config() -> Optional[Dict[str, Any]]:
-    """Load application configuration from JSON file"""
+    """
+    Load application configuration from JSON file
+    The file is read once per process; call load_app_config.cache_clear() to reload
+    """
     if not CONFIG_FILE.exists():
         return None
     
@@ -4,10 +4,11 @@ Handles environment variables and configuration files
 """
 import os
 import yaml
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Tuple
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, PrivateAttr, model_validator
 
 
 class Settings(BaseSettings):
@@ -23,11 +24,20 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", env="HOST")
     port: int = Field(default=8000, env="PORT")
     api_prefix: str = Field(default="/api", env="API_PREFIX")
+    # Worker processes when not reloading (0 = one per CPU core, minus one)
+    workers: int = Field(default=0, env="WORKERS")
     
     # Database
     database_type: str = Field(default="sqlite", env="DATABASE_TYPE")
     sqlite_db_path: str = Field(default="./data/app.db", env="SQLITE_DB_PATH")
     
+    # Connection pool (PostgreSQL/MySQL)
+    db_pool_size: int = Field(default=20, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, env="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=False, env="DB_POOL_PRE_PING")
+    sql_echo: bool = Field(default=False, env="SQL_ECHO")
+    
     # PostgreSQL
     postgres_host: str = Field(default="localhost", env="POSTGRES_HOST")
     postgres_port: int = Field(default=5432, env="POSTGRES_PORT")
@@ -54,11 +64,15 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
     jwt_access_token_expire_minutes: int = Field(default=30, env="JWT_ACCESS_TOKEN_EXPIRE_MINUTES")
     
+    # Password hashing (bcrypt cost factor, 4-31)
+    bcrypt_rounds: int = Field(default=12, env="BCRYPT_ROUNDS")
+    
     # CORS
     cors_origins: str = Field(
         default="http://localhost:3000,http://localhost:5173,http://localhost:8000",
         env="CORS_ORIGINS"
     )
+    cors_max_age: int = Field(default=86400, env="CORS_MAX_AGE")
     
     # Frontend
     frontend_build_path: str = Field(default="./frontend/dist", env="FRONTEND_BUILD_PATH")
@@ -66,18 +80,29 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: str = Field(default="./logs/app.log", env="LOG_FILE")
+    log_max_bytes: int = Field(default=10485760, env="LOG_MAX_BYTES")
+    log_backup_count: int = Field(default=5, env="LOG_BACKUP_COUNT")
     
-    @property
-    def cors_origins_list(self) -> List[str]:
+    # CORS origins parsed once at load time
+    _cors_origins: Tuple[str, ...] = PrivateAttr(default=())
+    
+    @model_validator(mode="after")
+    def _parse_cors_origins(self) -> "Settings":
         """Parse CORS origins from comma-separated string"""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+        self._cors_origins = tuple(origin.strip() for origin in self.cors_origins.split(","))
+        return self
     
     @property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """CORS origins as an immutable tuple"""
+        return self._cors_origins
+    
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode"""
         return self.environment.lower() == "development"
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode"""
         return self.environment.lower() == "production"
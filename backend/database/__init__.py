@@ -4,14 +4,21 @@ Provides database connection and models
 """
 
 from .connection import get_database, DatabaseFactory, DatabaseType, db_engine
+from .backends import SQLBackend, MongoBackend, db_backend
 
 # Import models only if Base is available (SQL databases)
 try:
     from .models import Base, User
-    __all__ = ["get_database", "DatabaseFactory", "DatabaseType", "Base", "User", "db_engine"]
+    __all__ = [
+        "get_database", "DatabaseFactory", "DatabaseType", "Base", "User", "db_engine",
+        "SQLBackend", "MongoBackend", "db_backend"
+    ]
 except (ImportError, AttributeError):
     # MongoDB doesn't use SQLAlchemy models
     Base = None
     User = None
-    __all__ = ["get_database", "DatabaseFactory", "DatabaseType", "db_engine"]
+    __all__ = [
+        "get_database", "DatabaseFactory", "DatabaseType", "db_engine",
+        "SQLBackend", "MongoBackend", "db_backend"
+    ]
 
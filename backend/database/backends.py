@@ -0,0 +1,183 @@
+"""
+Database Backends
+User storage operations with one implementation per database family
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Engine, exists, select, text
+from sqlalchemy.orm import Session
+from pymongo.database import Database as MongoDatabase
+
+from backend.database.connection import db_engine
+from backend.database.models import User
+
+
+class SQLBackend:
+    """User storage for SQL databases (SQLite, PostgreSQL, MySQL)"""
+    
+    def __init__(self, engine: Engine):
+        self.engine = engine
+    
+    def ping(self) -> None:
+        """Check the database connection"""
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    
+    def get_user_by_username(self, db: Session, username: str) -> Optional[Dict[str, Any]]:
+        """Get a user by username, including the password hash"""
+        user = db.query(User).filter(User.username == username).first()
+        if user is None:
+            return None
+        return {
+            "id": user.id,
+            "email": user.email,
+            "username": user.username,
+            "full_name": user.full_name,
+            "hashed_password": user.hashed_password,
+            "is_active": user.is_active
+        }
+    
+    def user_exists(self, db: Session, email: str, username: str) -> bool:
+        """Check whether the email or username is already registered"""
+        # Two single-index EXISTS probes instead of one OR across both columns
+        if db.execute(select(exists().where(User.email == email))).scalar():
+            return True
+        return bool(db.execute(select(exists().where(User.username == username))).scalar())
+    
+    def create_user(
+        self,
+        db: Session,
+        email: str,
+        username: str,
+        hashed_password: str,
+        full_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new user"""
+        new_user = User(
+            email=email,
+            username=username,
+            hashed_password=hashed_password,
+            full_name=full_name
+        )
+        db.add(new_user)
+        db.commit()
+        db.refresh(new_user)
+        
+        return {
+            "id": new_user.id,
+            "email": new_user.email,
+            "username": new_user.username,
+            "full_name": new_user.full_name,
+            "is_active": new_user.is_active
+        }
+    
+    def list_users(self, db: Session, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """List users without their password hashes"""
+        # Select plain columns, no ORM instances needed
+        stmt = select(
+            User.id, User.email, User.username, User.full_name, User.is_active
+        ).offset(skip).limit(limit)
+        return [
+            {
+                "id": user_id,
+                "email": email,
+                "username": username,
+                "full_name": full_name,
+                "is_active": is_active
+            }
+            for user_id, email, username, full_name, is_active in db.execute(stmt)
+        ]
+
+
+class MongoBackend:
+    """User storage for MongoDB"""
+    
+    def __init__(self, database: MongoDatabase):
+        self.database = database
+    
+    def ping(self) -> None:
+        """Check the database connection"""
+        self.database.command("ping")
+    
+    def create_indexes(self) -> None:
+        """Create the unique indexes behind the username/email lookups"""
+        # create_index is idempotent, so every worker may run this
+        self.database.users.create_index("username", unique=True)
+        self.database.users.create_index("email", unique=True)
+    
+    def get_user_by_username(self, db: MongoDatabase, username: str) -> Optional[Dict[str, Any]]:
+        """Get a user by username, including the password hash"""
+        user = db.users.find_one({"username": username})
+        if user is None:
+            return None
+        return {
+            "id": str(user["_id"]),
+            "email": user["email"],
+            "username": user["username"],
+            "full_name": user.get("full_name"),
+            "hashed_password": user["hashed_password"],
+            "is_active": user.get("is_active", True)
+        }
+    
+    def user_exists(self, db: MongoDatabase, email: str, username: str) -> bool:
+        """Check whether the email or username is already registered"""
+        # Two indexed equality probes instead of an $or, fetching only _id
+        if db.users.find_one({"username": username}, {"_id": 1}) is not None:
+            return True
+        return db.users.find_one({"email": email}, {"_id": 1}) is not None
+    
+    def create_user(
+        self,
+        db: MongoDatabase,
+        email: str,
+        username: str,
+        hashed_password: str,
+        full_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new user"""
+        now = datetime.now(timezone.utc)
+        user_doc = {
+            "email": email,
+            "username": username,
+            "hashed_password": hashed_password,
+            "full_name": full_name,
+            "is_active": True,
+            "is_superuser": False,
+            "created_at": now,
+            "updated_at": now
+        }
+        result = db.users.insert_one(user_doc)
+        
+        return {
+            "id": str(result.inserted_id),
+            "email": user_doc["email"],
+            "username": user_doc["username"],
+            "full_name": user_doc["full_name"],
+            "is_active": user_doc["is_active"]
+        }
+    
+    def list_users(self, db: MongoDatabase, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """List users without their password hashes"""
+        # Project away hashed_password so it is never decoded from BSON
+        cursor = db.users.find(
+            {},
+            {"_id": 1, "email": 1, "username": 1, "full_name": 1, "is_active": 1}
+        ).skip(skip).limit(limit)
+        return [
+            {
+                "id": str(user["_id"]),
+                "email": user["email"],
+                "username": user["username"],
+                "full_name": user.get("full_name"),
+                "is_active": user.get("is_active", True)
+            }
+            for user in cursor
+        ]
+
+
+# Backend for the configured database, selected once at startup
+if isinstance(db_engine, Engine):
+    db_backend = SQLBackend(db_engine)
+else:
+    db_backend = MongoBackend(db_engine)
@@ -33,7 +33,7 @@ class DatabaseFactory:
         return create_engine(
             f"sqlite:///{db_path}",
             connect_args={"check_same_thread": False},
-            echo=settings.debug
+            echo=settings.sql_echo
         )
     
     @staticmethod
@@ -48,10 +48,11 @@ class DatabaseFactory:
         connection_string = f"postgresql://{user}:{password}@{host}:{port}/{database}"
         return create_engine(
             connection_string,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
-            echo=settings.debug
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.is_production and settings.db_pool_pre_ping,
+            echo=settings.sql_echo
         )
     
     @staticmethod
@@ -66,10 +67,11 @@ class DatabaseFactory:
         connection_string = f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}"
         return create_engine(
             connection_string,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
-            echo=settings.debug
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.is_production and settings.db_pool_pre_ping,
+            echo=settings.sql_echo
         )
     
     @staticmethod
@@ -94,38 +96,39 @@ class DatabaseFactory:
         """Create database engine based on configuration"""
         db_type = settings.database_type.lower()
         
-        if db_type == DatabaseType.SQLITE:
-            return DatabaseFactory.create_sqlite_engine(settings.sqlite_db_path)
-        
-        elif db_type == DatabaseType.POSTGRESQL:
-            return DatabaseFactory.create_postgresql_engine(
-                settings.postgres_host,
-                settings.postgres_port,
-                settings.postgres_db,
-                settings.postgres_user,
-                settings.postgres_password
-            )
-        
-        elif db_type == DatabaseType.MYSQL:
-            return DatabaseFactory.create_mysql_engine(
-                settings.mysql_host,
-                settings.mysql_port,
-                settings.mysql_db,
-                settings.mysql_user,
-                settings.mysql_password
-            )
-        
-        elif db_type == DatabaseType.MONGODB:
-            return DatabaseFactory.create_mongodb_client(
-                settings.mongodb_host,
-                settings.mongodb_port,
-                settings.mongodb_db,
-                settings.mongodb_user if settings.mongodb_user else None,
-                settings.mongodb_password if settings.mongodb_password else None
-            )
-        
-        else:
+        builder = _ENGINE_BUILDERS.get(db_type)
+        if builder is None:
             raise ValueError(f"Unsupported database type: {db_type}")
+        return builder()
+
+
+# Engine builders keyed by database type value
+_ENGINE_BUILDERS = {
+    DatabaseType.SQLITE.value: lambda: DatabaseFactory.create_sqlite_engine(
+        settings.sqlite_db_path
+    ),
+    DatabaseType.POSTGRESQL.value: lambda: DatabaseFactory.create_postgresql_engine(
+        settings.postgres_host,
+        settings.postgres_port,
+        settings.postgres_db,
+        settings.postgres_user,
+        settings.postgres_password
+    ),
+    DatabaseType.MYSQL.value: lambda: DatabaseFactory.create_mysql_engine(
+        settings.mysql_host,
+        settings.mysql_port,
+        settings.mysql_db,
+        settings.mysql_user,
+        settings.mysql_password
+    ),
+    DatabaseType.MONGODB.value: lambda: DatabaseFactory.create_mongodb_client(
+        settings.mongodb_host,
+        settings.mongodb_port,
+        settings.mongodb_db,
+        settings.mongodb_user if settings.mongodb_user else None,
+        settings.mongodb_password if settings.mongodb_password else None
+    ),
+}
 
 
 # Create database engine
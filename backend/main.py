@@ -2,12 +2,17 @@
 PyReact Fusion - Main Application Entry Point
 FastAPI application with static file serving and API routes
 """
+import asyncio
 import logging
 import os
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
 from pathlib import Path
+from typing import Final
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from sqlalchemy import Engine
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -15,75 +20,132 @@ from backend.config import settings
 from backend.app_config import get_app_info, get_app_mode
 from backend.api.routes import router
 from backend.api.middleware import setup_middleware
+from backend.static_files import CachedStaticFiles, IndexFile
+from backend.server import loop_and_http
 from backend.database.connection import db_engine, DatabaseType
+from backend.database.backends import db_backend
 from backend.database.models import Base
 
-# Configure logging
-os.makedirs(os.path.dirname(settings.log_file) if os.path.dirname(settings.log_file) else ".", exist_ok=True)
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(settings.log_file),
-        logging.StreamHandler()
-    ]
-)
+
+def _worker_count() -> int:
+    """Number of uvicorn worker processes main() will start"""
+    # One process per core sidesteps the GIL; the reloader only supports one
+    if settings.is_development and settings.debug:
+        return 1
+    return settings.workers or max(1, (os.cpu_count() or 2) - 1)
+
+
+def _setup_logging() -> QueueListener:
+    """Route root logging through a queue, once per process"""
+    root_logger = logging.getLogger()
+    # uvicorn re-imports this module as backend.main when it runs as
+    # __main__ (and workers import it via __mp_main__); reuse the first setup
+    for handler in root_logger.handlers:
+        listener = getattr(handler, "listener", None)
+        if isinstance(handler, QueueHandler) and listener is not None:
+            return listener
+    
+    os.makedirs(os.path.dirname(settings.log_file) if os.path.dirname(settings.log_file) else ".", exist_ok=True)
+    # Several processes cannot rotate one file; with workers, reopen the file
+    # when an external tool (logrotate) moves it instead. WORKERS is only
+    # above 1 when configured so or when main() starts several processes
+    if settings.workers > 1:
+        file_handler = WatchedFileHandler(settings.log_file, encoding="utf-8", delay=True)
+    else:
+        file_handler = RotatingFileHandler(
+            settings.log_file,
+            maxBytes=settings.log_max_bytes,
+            backupCount=settings.log_backup_count,
+            encoding="utf-8",
+            delay=True
+        )
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = (file_handler, logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.listener = QueueListener(log_queue, *handlers)
+    root_logger.setLevel(getattr(logging, settings.log_level.upper()))
+    root_logger.addHandler(queue_handler)
+    return queue_handler.listener
+
+
+# Configure logging: callers only enqueue records, a listener thread
+# (started in lifespan) does the file and console I/O
+log_listener = _setup_logging()
 
 logger = logging.getLogger(__name__)
 
 # Get app info from config
 app_info = get_app_info()
 app_mode = get_app_mode()
+_APP_NAME = app_info.get("name", settings.app_name)
+_APP_VERSION = app_info.get("version", settings.app_version)
+_APP_DESCRIPTION = app_info.get("description", "Production-ready full-stack application template")
 
-# Create FastAPI app
-app = FastAPI(
-    title=app_info.get("name", settings.app_name),
-    version=app_info.get("version", settings.app_version),
-    description=app_info.get("description", "Production-ready full-stack application template"),
-    docs_url="/api/docs" if settings.is_development else None,
-    redoc_url="/api/redoc" if settings.is_development else None,
-)
-
-# Setup middleware
-setup_middleware(app)
-
-# Include API routes
-app.include_router(router, prefix=settings.api_prefix)
+# Database family is fixed for the life of the process
+IS_SQL_DB: Final[bool] = settings.database_type.lower() != DatabaseType.MONGODB
 
 
-# Initialize database tables (for SQL databases only)
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup"""
-    app_name = app_info.get("name", settings.app_name)
-    app_version = app_info.get("version", settings.app_version)
-    logger.info(f"Starting {app_name} v{app_version}")
+# Application lifecycle
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database on startup and clean up on shutdown"""
+    log_listener.start()
+    logger.info(f"Starting {_APP_NAME} v{_APP_VERSION}")
     logger.info(f"Mode: {app_mode.title()}")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Database type: {settings.database_type}")
     
-    # Create tables for SQL databases
-    from sqlalchemy import Engine
-    
-    if settings.database_type.lower() != DatabaseType.MONGODB and Base is not None and isinstance(db_engine, Engine):
+    # Create tables for SQL databases (checkfirst makes this safe to repeat
+    # per worker; a lost race between workers is only logged)
+    if IS_SQL_DB and Base is not None and isinstance(db_engine, Engine):
         try:
-            Base.metadata.create_all(bind=db_engine)
+            # DDL is blocking I/O, keep it off the event loop
+            await asyncio.to_thread(Base.metadata.create_all, bind=db_engine)
             logger.info("Database tables initialized")
         except Exception as e:
             logger.error(f"Error initializing database tables: {e}")
+    elif not IS_SQL_DB:
+        try:
+            # Server selection can block for seconds, keep it off the event loop
+            await asyncio.to_thread(db_backend.create_indexes)
+            logger.info("MongoDB indexes initialized")
+        except Exception as e:
+            logger.warning(f"Could not create MongoDB indexes: {e}")
+    
+    yield
+    
+    logger.info("Shutting down application")
+    # Flushes everything still queued before the process exits
+    log_listener.stop()
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    logger.info("Shutting down application")
+# Create FastAPI app
+app = FastAPI(
+    title=_APP_NAME,
+    version=_APP_VERSION,
+    description=_APP_DESCRIPTION,
+    docs_url="/api/docs" if settings.is_development else None,
+    redoc_url="/api/redoc" if settings.is_development else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Setup middleware
+setup_middleware(app)
+
+# Include API routes
+app.include_router(router, prefix=settings.api_prefix)
 
 
 # Exception handlers
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail}
     )
@@ -92,52 +154,44 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={"error": "Validation error", "details": exc.errors()}
     )
 
 
+# Paths the SPA fallback must never answer
+_RESERVED_PREFIXES = ("api/", "docs", "redoc", "openapi.json", "static/")
+
 # Serve static files (React app)
 frontend_path = Path(settings.frontend_build_path).resolve()
+_INDEX_PATH = frontend_path / "index.html"
+_STATIC_DIR = frontend_path / "static"
 
-if frontend_path.exists() and (frontend_path / "index.html").exists():
+# index.html being a file implies the build directory exists
+if _INDEX_PATH.is_file():
     # Mount static files directory - this must come BEFORE the catch-all route
-    static_dir = frontend_path / "static"
-    if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-        logger.info(f"Mounted static files from: {static_dir}")
+    if _STATIC_DIR.is_dir():
+        app.mount(
+            "/static",
+            CachedStaticFiles(directory=str(_STATIC_DIR), precompress=True),
+            name="static"
+        )
+        logger.info(f"Mounted static files from: {_STATIC_DIR}")
     
-    # Serve index.html for root
-    @app.get("/")
-    async def serve_root():
-        """Serve React app index.html for root path"""
-        index_file = frontend_path / "index.html"
-        if index_file.exists():
-            return FileResponse(str(index_file))
-        return JSONResponse(status_code=404, content={"error": "Index file not found"})
+    # index.html is an immutable build artifact: read it once and serve from memory
+    _INDEX = IndexFile(_INDEX_PATH)
     
-    # Serve index.html for all other non-API routes (SPA routing)
+    # Serve index.html for the root and all other non-API routes (SPA routing)
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str, request: Request):
-        """Serve React app for all non-API routes"""
+        """Serve React app for all non-API routes, including the root path"""
         # Don't serve SPA for API routes or static files
-        if (full_path.startswith("api/") or 
-            full_path.startswith("docs") or 
-            full_path.startswith("redoc") or 
-            full_path.startswith("openapi.json") or
-            full_path.startswith("static/")):
-            return JSONResponse(status_code=404, content={"error": "Not found"})
+        if full_path.startswith(_RESERVED_PREFIXES):
+            return ORJSONResponse(status_code=404, content={"error": "Not found"})
         
         # Serve index.html for all other routes (SPA fallback)
-        index_file = frontend_path / "index.html"
-        if index_file.exists():
-            return FileResponse(str(index_file))
-        else:
-            return JSONResponse(
-                status_code=404,
-                content={"error": "Frontend not built. Run 'python scripts/build_frontend.py' first."}
-            )
+        return _INDEX.response(request.headers)
     
     logger.info(f"Frontend will be served from: {frontend_path}")
 else:
@@ -147,7 +201,7 @@ else:
     # Still serve a basic response for root
     @app.get("/")
     async def root():
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "error": "Frontend not built",
@@ -160,12 +214,25 @@ def main():
     """Main entry point for running the application"""
     import uvicorn
     
+    reload = settings.is_development and settings.debug
+    # Reload mode forces asyncio; otherwise ask for the fast loop and parser explicitly
+    server_options = {"loop": "auto", "http": "auto"} if reload else loop_and_http()
+    
+    workers = _worker_count()
+    if workers > 1:
+        # Spawned workers read this back to pick a multi-process log handler
+        os.environ["WORKERS"] = str(workers)
+    
     uvicorn.run(
         "backend.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.is_development and settings.debug,
-        log_level=settings.log_level.lower()
+        reload=reload,
+        log_level=settings.log_level.lower(),
+        workers=workers,
+        lifespan="on",
+        access_log=not settings.is_production,
+        **server_options
     )
 
 
@@ -0,0 +1,15 @@
+"""
+Server Options
+uvicorn event loop and HTTP parser selection shared by every launcher
+"""
+import importlib.util
+
+
+def loop_and_http() -> dict:
+    """uvicorn loop/http options naming the fastest installed implementations"""
+    # uvloop/httptools when installed, otherwise the pure-Python defaults
+    # (uvloop has no Windows build)
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+    }
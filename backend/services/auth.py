@@ -2,14 +2,23 @@
 Authentication Service
 Handles JWT token generation and password hashing
 """
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
+import bcrypt
+from cachetools import TTLCache
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 from backend.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes of a password
+_BCRYPT_MAX_BYTES = 72
+
+# Verified JWT payloads keyed by a digest of the token, as (payload, exp)
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
 
 
 class AuthService:
@@ -18,12 +27,31 @@ class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return pwd_context.verify(plain_password, hashed_password)
+        if isinstance(hashed_password, str):
+            hashed_password = hashed_password.encode("utf-8")
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:_BCRYPT_MAX_BYTES],
+            hashed_password
+        )
     
     @staticmethod
     def get_password_hash(password: str) -> str:
         """Hash a password"""
-        return pwd_context.hash(password)
+        hashed = bcrypt.hashpw(
+            password.encode("utf-8")[:_BCRYPT_MAX_BYTES],
+            bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+        )
+        return hashed.decode("utf-8")
+    
+    @staticmethod
+    async def averify_password(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the threadpool so bcrypt doesn't block the event loop"""
+        return await run_in_threadpool(AuthService.verify_password, plain_password, hashed_password)
+    
+    @staticmethod
+    async def aget_password_hash(password: str) -> str:
+        """Hash a password on the threadpool so bcrypt doesn't block the event loop"""
+        return await run_in_threadpool(AuthService.get_password_hash, password)
     
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -47,14 +75,29 @@ class AuthService:
     
     @staticmethod
     def decode_access_token(token: str) -> Optional[dict]:
-        """Decode and verify a JWT token"""
+        """Decode and verify a JWT token, reusing recently verified payloads"""
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.time()
+        
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+        if cached is not None:
+            payload, expires_at = cached
+            # Never serve a payload past the token's own expiry
+            if expires_at > now:
+                return payload
+        
         try:
             payload = jwt.decode(
                 token,
                 settings.jwt_secret_key,
                 algorithms=[settings.jwt_algorithm]
             )
-            return payload
         except JWTError:
+            # Invalid tokens are never cached
             return None
+        
+        with _token_cache_lock:
+            _token_cache[key] = (payload, payload.get("exp", now))
+        return payload
 
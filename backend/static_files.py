@@ -0,0 +1,235 @@
+"""
+Static File Serving
+StaticFiles with cached gzip for text assets and zero-copy file sends
+"""
+import gzip
+import hashlib
+import os
+from typing import Dict, Optional, Tuple
+
+from cachetools import LRUCache
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+try:
+    import brotli
+except ImportError:  # optional, only needed to write .br files at build time
+    brotli = None
+
+# Asset types worth compressing
+COMPRESSIBLE_SUFFIXES = (".js", ".css", ".html", ".svg", ".json")
+
+# Build-time compressed siblings (content-encoding, file suffix), best first
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# ASGI extension servers advertise when they can sendfile() for us
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+def precompress_directory(directory, brotli_quality: int = 11, gzip_level: int = 9) -> int:
+    """
+    Write .gz (and .br, when brotli is installed) next to every compressible asset
+    Meant for build scripts; returns the number of assets compressed
+    """
+    count = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            with open(path + ".gz", "wb") as f:
+                f.write(gzip.compress(data, compresslevel=gzip_level, mtime=0))
+            if brotli is not None:
+                with open(path + ".br", "wb") as f:
+                    f.write(brotli.compress(data, quality=brotli_quality))
+            count += 1
+    return count
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value"""
+    qvalues = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    return qvalues
+
+
+def _quality(qvalues: Dict[str, float], encoding: str) -> float:
+    """q-value the client gives encoding, falling back to the * wildcard"""
+    return qvalues.get(encoding, qvalues.get("*", 0.0))
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against etag, accepting lists and weak tags"""
+    # Proxies that compress on the fly (nginx gzip) weaken etags to W/"..."
+    return any(
+        tag == "*" or tag == etag
+        for tag in (tag.strip(" W/") for tag in if_none_match.split(","))
+    )
+
+
+class IndexFile:
+    """HTML entry point read once and served from memory with an etag"""
+    
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.body = f.read()
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=8).hexdigest()}"'
+        # Browsers must revalidate every navigation, which the etag makes a cheap 304
+        self.headers = {"etag": self.etag, "cache-control": "public, max-age=0, must-revalidate"}
+    
+    def response(self, request_headers: Headers) -> Response:
+        """Return the file, or 304 if the client already has it"""
+        if etag_matches(request_headers.get("if-none-match", ""), self.etag):
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="text/html", headers=self.headers)
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """FileResponse that hands the open file to the server instead of streaming chunks"""
+    
+    async def __call__(self, scope, receive, send):
+        if self.send_header_only:
+            await super().__call__(scope, receive, send)
+            return
+        
+        with open(self.path, "rb") as file:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            await send({
+                "type": ZEROCOPY_EXTENSION,
+                "file": file,
+                "more_body": False,
+            })
+        
+        if self.background is not None:
+            await self.background()
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves text assets from build-time .br/.gz siblings when
+    present, otherwise gzip-compressed from an in-memory cache, and uses
+    zero-copy sends for everything else when the server supports it
+    """
+    
+    def __init__(self, *args, cache_size: int = 256, precompress: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        # full path -> (st_mtime_ns, gzip bytes), rebuilt when the file changes
+        self._gzip_cache = LRUCache(maxsize=cache_size)
+        # full path -> (st_mtime_ns, ((encoding, sibling path, sibling stat), ...))
+        self._sibling_cache = LRUCache(maxsize=cache_size)
+        if precompress and self.directory is not None:
+            self._precompress(str(self.directory))
+    
+    def _precompress(self, directory: str) -> None:
+        """Fill the gzip cache for every compressible asset under directory"""
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.endswith(COMPRESSIBLE_SUFFIXES):
+                    path = os.path.join(root, name)
+                    stat_result = os.stat(path)
+                    # Skip assets the build already compressed
+                    if not self._siblings(path, stat_result):
+                        self._gzipped(path, stat_result)
+    
+    def _siblings(self, path: str, stat_result: os.stat_result) -> Tuple[tuple, ...]:
+        """Get the up-to-date precompressed siblings of path, best encoding first"""
+        cached: Optional[tuple] = self._sibling_cache.get(path)
+        if cached is None or cached[0] != stat_result.st_mtime_ns:
+            found = []
+            for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+                try:
+                    sibling_stat = os.stat(path + suffix)
+                except OSError:
+                    continue
+                # A sibling older than its source is stale
+                if sibling_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                    found.append((encoding, path + suffix, sibling_stat))
+            cached = (stat_result.st_mtime_ns, tuple(found))
+            self._sibling_cache[path] = cached
+        return cached[1]
+    
+    def _gzipped(self, path: str, stat_result: os.stat_result) -> bytes:
+        """Get gzip-compressed file contents, compressing on first use or change"""
+        cached: Optional[tuple] = self._gzip_cache.get(path)
+        if cached is None or cached[0] != stat_result.st_mtime_ns:
+            with open(path, "rb") as f:
+                cached = (stat_result.st_mtime_ns, gzip.compress(f.read(), compresslevel=6))
+            self._gzip_cache[path] = cached
+        return cached[1]
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        method = scope["method"]
+        request_headers = Headers(scope=scope)
+        path = os.fspath(full_path)
+        
+        response_class = FileResponse
+        if ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+            response_class = ZeroCopyFileResponse
+        
+        response = response_class(
+            path, status_code=status_code, stat_result=stat_result, method=method
+        )
+        
+        if path.endswith(COMPRESSIBLE_SUFFIXES):
+            response.headers["vary"] = "Accept-Encoding"
+            qvalues = parse_accept_encoding(request_headers.get("accept-encoding", ""))
+            # Highest client q-value wins; ties keep our own preference order
+            sibling = max(
+                (s for s in self._siblings(path, stat_result) if _quality(qvalues, s[0]) > 0),
+                key=lambda s: _quality(qvalues, s[0]),
+                default=None
+            )
+            if sibling is not None:
+                encoding, sibling_path, sibling_stat = sibling
+                # etag/last-modified come from the sibling, so they differ per encoding
+                response = response_class(
+                    sibling_path,
+                    status_code=status_code,
+                    headers={"content-encoding": encoding, "vary": "Accept-Encoding"},
+                    media_type=response.media_type,
+                    stat_result=sibling_stat,
+                    method=method
+                )
+            elif _quality(qvalues, "gzip") > 0:
+                response = Response(
+                    self._gzipped(path, stat_result),
+                    status_code=status_code,
+                    media_type=response.media_type,
+                    headers={
+                        "content-encoding": "gzip",
+                        "vary": "Accept-Encoding",
+                        "etag": response.headers["etag"] + "-gzip",
+                        "last-modified": response.headers["last-modified"],
+                    }
+                )
+        
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+    
+    def is_not_modified(self, response_headers: Headers, request_headers: Headers) -> bool:
+        # Starlette compares If-None-Match verbatim; accept lists and weak tags
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None and "etag" in response_headers:
+            return etag_matches(if_none_match, response_headers["etag"])
+        return super().is_not_modified(response_headers, request_headers)
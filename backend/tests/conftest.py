@@ -0,0 +1,42 @@
+"""
+Shared test fixtures
+"""
+import os
+
+# Minimum bcrypt cost for the suite: still real salted bcrypt, just cheap.
+# Must be set before backend.config builds its settings
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import pytest
+from fastapi.testclient import TestClient
+from backend.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client shared by the whole session; entering it runs the app lifespan"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth_token(client):
+    """Access token for a user registered once per session"""
+    user_data = {
+        "username": "sessionuser",
+        "email": "sessionuser@example.com",
+        "password": "testpassword123",
+    }
+    
+    # 400 just means a previous run already registered the user
+    client.post("/api/auth/register", json=user_data)
+    
+    response = client.post(
+        "/api/auth/login",
+        data={
+            "username": user_data["username"],
+            "password": user_data["password"]
+        }
+    )
+    assert response.status_code == 200
+    return response.json()["access_token"]
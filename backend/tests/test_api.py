@@ -2,13 +2,13 @@
 Tests for API endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
-from backend.main import app
 
-client = TestClient(app)
+from backend.api import routes
+from backend.config import settings
+from backend.services.auth import AuthService
 
 
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint"""
     response = client.get("/api/health")
     assert response.status_code == 200
@@ -18,7 +18,7 @@ def test_health_check():
     assert "database" in data
 
 
-def test_register_user():
+def test_register_user(client):
     """Test user registration"""
     user_data = {
         "username": "testuser",
@@ -39,7 +39,7 @@ def test_register_user():
         assert data["email"] == user_data["email"]
 
 
-def test_login():
+def test_login(client):
     """Test user login"""
     # First register a user
     user_data = {
@@ -68,7 +68,7 @@ def test_login():
     assert data["token_type"] == "bearer"
 
 
-def test_protected_endpoint():
+def test_protected_endpoint(client):
     """Test protected endpoint without authentication"""
     response = client.get("/api/users")
     
@@ -76,34 +76,65 @@ def test_protected_endpoint():
     assert response.status_code == 401
 
 
-def test_protected_endpoint_with_token():
+def test_protected_endpoint_with_token(client, auth_token):
     """Test protected endpoint with valid token"""
-    # Register and login
-    user_data = {
-        "username": "protectedtest",
-        "email": "protectedtest@example.com",
-        "password": "testpassword123",
-    }
-    
-    client.post("/api/auth/register", json=user_data)
-    
-    login_response = client.post(
-        "/api/auth/login",
-        data={
-            "username": user_data["username"],
-            "password": user_data["password"]
-        }
-    )
-    
-    token = login_response.json()["access_token"]
-    
-    # Access protected endpoint
     response = client.get(
         "/api/users",
-        headers={"Authorization": f"Bearer {token}"}
+        headers={"Authorization": f"Bearer {auth_token}"}
     )
     
     # Should succeed
     assert response.status_code == 200
     assert isinstance(response.json(), list)
 
+
+
+@pytest.fixture
+def counted_verify(monkeypatch):
+    """Enable the login verify cache and count real password checks"""
+    calls = []
+    real_verify = AuthService.averify_password
+    
+    async def counting_verify(plain_password, hashed_password):
+        calls.append(plain_password)
+        return await real_verify(plain_password, hashed_password)
+    
+    monkeypatch.setattr(settings, "debug", False)
+    monkeypatch.setattr(AuthService, "averify_password", staticmethod(counting_verify))
+    routes._verify_cache.clear()
+    yield calls
+    routes._verify_cache.clear()
+
+
+def _login(client, username, password):
+    """Post the login form"""
+    return client.post("/api/auth/login", data={"username": username, "password": password})
+
+
+def test_login_cache_rejects_wrong_password(client, counted_verify):
+    """Test a cached successful login does not let a wrong password through"""
+    client.post("/api/auth/register", json={
+        "username": "cacheduser",
+        "email": "cacheduser@example.com",
+        "password": "testpassword123",
+    })
+    
+    assert _login(client, "cacheduser", "testpassword123").status_code == 200
+    assert _login(client, "cacheduser", "testpassword123").status_code == 200
+    assert counted_verify == ["testpassword123"]
+    
+    assert _login(client, "cacheduser", "wrongpassword").status_code == 401
+
+
+def test_login_cache_never_stores_failures(client, counted_verify):
+    """Test every failed password check runs the full verification"""
+    client.post("/api/auth/register", json={
+        "username": "failcacheuser",
+        "email": "failcacheuser@example.com",
+        "password": "testpassword123",
+    })
+    
+    assert _login(client, "failcacheuser", "wrongpassword").status_code == 401
+    assert _login(client, "failcacheuser", "wrongpassword").status_code == 401
+    assert counted_verify == ["wrongpassword", "wrongpassword"]
+    assert len(routes._verify_cache) == 0
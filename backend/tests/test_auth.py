@@ -2,6 +2,9 @@
 Tests for authentication service
 """
 import pytest
+from datetime import timedelta
+from backend.config import settings
+from backend.services import auth as auth_module
 from backend.services.auth import AuthService
 
 
@@ -23,6 +26,19 @@ def test_password_hashing():
     assert auth_service.verify_password("wrong_password", hashed) is False
 
 
+@pytest.mark.slow
+def test_real_bcrypt_cost(monkeypatch):
+    """Test hashing at the production bcrypt cost"""
+    monkeypatch.setattr(settings, "bcrypt_rounds", 12)
+    auth_service = AuthService()
+    
+    hashed = auth_service.get_password_hash("test_password_123")
+    
+    # Cost factor is encoded in the hash
+    assert hashed.startswith("$2b$12$")
+    assert auth_service.verify_password("test_password_123", hashed) is True
+
+
 def test_jwt_token_creation():
     """Test JWT token creation and decoding"""
     auth_service = AuthService()
@@ -56,3 +72,53 @@ def test_jwt_token_invalid():
     # Should return None
     assert decoded is None
 
+
+def test_jwt_token_cached_decode(monkeypatch):
+    """Test a repeated decode of the same token is served from the cache"""
+    auth_module._token_cache.clear()
+    calls = []
+    real_decode = auth_module.jwt.decode
+    
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+    
+    monkeypatch.setattr(auth_module.jwt, "decode", counting_decode)
+    auth_service = AuthService()
+    token = auth_service.create_access_token({"sub": "cacheduser"})
+    
+    first = auth_service.decode_access_token(token)
+    second = auth_service.decode_access_token(token)
+    assert first is not None
+    assert second == first
+    assert calls == [token]
+    
+    # Expired tokens are rejected
+    expired = auth_service.create_access_token(
+        {"sub": "cacheduser"},
+        expires_delta=timedelta(seconds=-1)
+    )
+    assert auth_service.decode_access_token(expired) is None
+
+
+def test_jwt_token_cache_respects_expiry(monkeypatch):
+    """Test a cached payload is not served once its exp has passed"""
+    auth_module._token_cache.clear()
+    auth_service = AuthService()
+    token = auth_service.create_access_token(
+        {"sub": "agedcacheuser"},
+        expires_delta=timedelta(seconds=-1)
+    )
+    real_decode = auth_module.jwt.decode
+    
+    # Cache the payload as if it had been verified before it expired
+    monkeypatch.setattr(
+        auth_module.jwt,
+        "decode",
+        lambda *args, **kwargs: real_decode(*args, options={"verify_exp": False}, **kwargs)
+    )
+    assert auth_service.decode_access_token(token) is not None
+    assert len(auth_module._token_cache) == 1
+    
+    monkeypatch.setattr(auth_module.jwt, "decode", real_decode)
+    assert auth_service.decode_access_token(token) is None
@@ -0,0 +1,187 @@
+"""
+Tests for static file serving
+"""
+import gzip
+import os
+
+import pytest
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from backend.static_files import (
+    CachedStaticFiles,
+    IndexFile,
+    ZeroCopyFileResponse,
+    ZEROCOPY_EXTENSION,
+    etag_matches,
+    parse_accept_encoding,
+)
+
+SCRIPT = b"console.log('hello');\n" * 50
+IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Directory with one compressible and one binary asset"""
+    (tmp_path / "app.js").write_bytes(SCRIPT)
+    (tmp_path / "logo.png").write_bytes(IMAGE)
+    return tmp_path
+
+
+@pytest.fixture
+def static_client(static_dir):
+    """Client for CachedStaticFiles mounted at /static"""
+    app = Starlette(routes=[Mount("/static", app=CachedStaticFiles(directory=str(static_dir)))])
+    return TestClient(app)
+
+
+@pytest.fixture
+def precompressed_dir(static_dir):
+    """static_dir with build-time .br and .gz siblings for app.js"""
+    (static_dir / "app.js.br").write_bytes(b"brotli placeholder")
+    (static_dir / "app.js.gz").write_bytes(gzip.compress(SCRIPT))
+    return static_dir
+
+
+def _file_response(directory, name, accept_encoding):
+    """Call file_response directly, so encoded bodies are never decoded"""
+    files = CachedStaticFiles(directory=str(directory))
+    path = directory / name
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    return files.file_response(path, path.stat(), scope)
+
+
+def test_gzip_response_has_own_etag(static_client):
+    """Test gzip responses get a distinct ETag that revalidates to 304"""
+    plain = static_client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    
+    compressed = static_client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.headers["etag"] == plain.headers["etag"] + "-gzip"
+    assert compressed.content == SCRIPT
+    
+    revalidated = static_client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+    
+    # The identity ETag must not validate the gzip representation
+    mismatched = static_client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]}
+    )
+    assert mismatched.status_code == 200
+
+
+def test_non_compressible_asset_passes_through(static_client):
+    """Test binary assets are served unchanged even when gzip is accepted"""
+    response = static_client.get("/static/logo.png", headers={"Accept-Encoding": "gzip, br"})
+    assert response.status_code == 200
+    assert response.content == IMAGE
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+@pytest.mark.parametrize("extensions, expected", [
+    ({}, FileResponse),
+    ({ZEROCOPY_EXTENSION: {}}, ZeroCopyFileResponse),
+])
+def test_zerocopy_only_when_advertised(static_dir, extensions, expected):
+    """Test zero-copy sends are used only when the server offers the extension"""
+    files = CachedStaticFiles(directory=str(static_dir))
+    path = static_dir / "logo.png"
+    scope = {"type": "http", "method": "GET", "headers": [], "extensions": extensions}
+    response = files.file_response(path, path.stat(), scope)
+    assert type(response) is expected
+
+
+def test_parse_accept_encoding():
+    """Test codings are parsed with their q-values"""
+    assert parse_accept_encoding("br;q=0, GZIP") == {"br": 0.0, "gzip": 1.0}
+    assert parse_accept_encoding("gzip; q=0.5, *;q=0.1") == {"gzip": 0.5, "*": 0.1}
+    assert parse_accept_encoding("") == {}
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("br;q=0.1, gzip;q=0.9", "gzip"),
+    ("*", "br"),
+])
+def test_precompressed_sibling_selection(precompressed_dir, accept_encoding, expected):
+    """Test the sibling is picked from the parsed Accept-Encoding"""
+    response = _file_response(precompressed_dir, "app.js", accept_encoding)
+    suffix = {"br": ".br", "gzip": ".gz"}[expected]
+    assert response.headers["content-encoding"] == expected
+    assert response.path == str(precompressed_dir / ("app.js" + suffix))
+    assert "javascript" in response.media_type
+
+
+def test_refused_encodings_serve_identity(precompressed_dir):
+    """Test q=0 for every coding falls back to the uncompressed file"""
+    response = _file_response(precompressed_dir, "app.js", "br;q=0, gzip;q=0")
+    assert "content-encoding" not in response.headers
+    assert response.path == str(precompressed_dir / "app.js")
+
+
+def test_stale_sibling_ignored(precompressed_dir):
+    """Test a sibling older than its source is not served"""
+    source_mtime = os.stat(precompressed_dir / "app.js").st_mtime
+    os.utime(precompressed_dir / "app.js.br", (source_mtime - 60, source_mtime - 60))
+    
+    response = _file_response(precompressed_dir, "app.js", "br, gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.path == str(precompressed_dir / "app.js.gz")
+
+
+def test_etag_matches():
+    """Test If-None-Match lists, weak validators and the wildcard"""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"old", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abcd"', '"abc"')
+    assert not etag_matches("", '"abc"')
+
+
+def test_weak_etag_revalidates_asset(static_client):
+    """Test a weakened asset etag from a proxy still gets a 304"""
+    plain = static_client.get("/static/logo.png")
+    weak = static_client.get("/static/logo.png", headers={"If-None-Match": f"W/{plain.headers['etag']}"})
+    assert weak.status_code == 304
+
+
+def test_index_file_revalidation(tmp_path):
+    """Test index.html is served with revalidation headers and 304s on a match"""
+    index_path = tmp_path / "index.html"
+    index_path.write_bytes(b"<!doctype html><div id=root></div>")
+    index = IndexFile(index_path)
+    
+    response = index.response(Headers())
+    assert response.status_code == 200
+    assert response.body == index_path.read_bytes()
+    assert response.headers["cache-control"] == "public, max-age=0, must-revalidate"
+    etag = response.headers["etag"]
+    
+    for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}'):
+        not_modified = index.response(Headers({"if-none-match": if_none_match}))
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.headers["cache-control"] == "public, max-age=0, must-revalidate"
+    
+    assert index.response(Headers({"if-none-match": '"stale"'})).status_code == 200
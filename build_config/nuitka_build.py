@@ -9,6 +9,11 @@ import shutil
 from pathlib import Path
 from typing import List, Optional
 
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.static_files import precompress_directory
+
 class NuitkaBuilder:
     """Nuitka build configuration and execution"""
     
@@ -52,6 +57,10 @@ class NuitkaBuilder:
         if frontend_dist.exists():
             shutil.copytree(frontend_dist, backend_static)
             print(f"✓ Copied frontend to {backend_static}")
+            
+            # Compress once here so the server never compresses at request time
+            count = precompress_directory(backend_static)
+            print(f"✓ Precompressed {count} assets")
     
     def get_nuitka_command(
         self,
@@ -77,6 +86,9 @@ class NuitkaBuilder:
         if mode == "onefile":
             cmd.append("--onefile")
         
+        # Compile the generated C on every core
+        cmd.append(f"--jobs={os.cpu_count() or 1}")
+        
         # Plugins
         for plugin in include_plugins:
             cmd.append(f"--enable-plugin={plugin}")
@@ -85,7 +97,7 @@ class NuitkaBuilder:
         cmd.extend([
             "--include-package=backend",
             "--include-package=config",
-            "--include-package=passlib",
+            "--include-package=bcrypt",
         ])
         
         # Include data directories
@@ -10,6 +10,10 @@ import shutil
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.static_files import precompress_directory
+
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
 BACKEND_DIR = PROJECT_ROOT / "backend"
 BUILD_DIR = PROJECT_ROOT / "build"
@@ -49,6 +53,10 @@ def copy_frontend_to_backend():
     
     shutil.copytree(frontend_dist, backend_static)
     print(f"✓ Copied frontend assets to {backend_static}")
+    
+    # Compress once here so the server never compresses at request time
+    count = precompress_directory(backend_static)
+    print(f"✓ Precompressed {count} assets")
 
 def build_with_nuitka():
     """Build executable using Nuitka"""
@@ -70,9 +78,10 @@ def build_with_nuitka():
         "--standalone",
         "--onefile",
         "--enable-plugin=anti-bloat",
+        f"--jobs={os.cpu_count() or 1}",  # parallel C compilation
         "--include-package=backend",
         "--include-package=config",
-        "--include-package=passlib",
+        "--include-package=bcrypt",
         "--include-data-dir=backend/static=backend/static",
         "--include-data-dir=config=config",
         "--output-dir=dist",
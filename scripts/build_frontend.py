@@ -4,15 +4,53 @@ Frontend Build Script
 Builds the React application for production
 """
 import os
+import shutil
 import sys
 import subprocess
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
+FRONTEND_INDEX = FRONTEND_DIR / "dist" / "index.html"
 
-def main():
-    """Build the frontend application"""
+# Modules the forkserver imports once, before forking any build child
+FORKSERVER_PRELOAD = ["pathlib", "subprocess", "rich.console", "scripts.build_frontend"]
+
+# Absolute path to pnpm (pnpm.cmd on Windows)
+PNPM = shutil.which("pnpm") or "pnpm"
+
+def forkserver_context():
+    """
+    Get the forkserver context with the build's imports preloaded, starting the
+    server if it is not running yet; None where the platform has no forkserver
+    """
+    import multiprocessing
+    from multiprocessing import forkserver
+    
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+    forkserver.ensure_running()
+    return ctx
+
+def _pnpm(*args):
+    """Run a pnpm command against the frontend directory"""
+    # --dir instead of cwd= and close_fds=False (Python's own fds are not
+    # inheritable) keep CPython on its posix_spawn path instead of fork+exec
+    return subprocess.run([PNPM, "--dir", str(FRONTEND_DIR), *args], check=False, close_fds=False)
+
+def _file_sizes(path):
+    """Yield the size of every regular file under path, one stat per entry"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _file_sizes(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.stat(follow_symlinks=False).st_size
+
+def build() -> bool:
+    """Build the frontend application, returning whether it succeeded"""
     print("=" * 60)
     print("Building React Frontend")
     print("=" * 60)
@@ -20,34 +58,38 @@ def main():
     # Check if frontend directory exists
     if not FRONTEND_DIR.exists():
         print(f"Error: Frontend directory not found at {FRONTEND_DIR}")
-        sys.exit(1)
+        return False
     
     # Check if node_modules exists
     if not (FRONTEND_DIR / "node_modules").exists():
         print("Installing frontend dependencies...")
-        os.chdir(FRONTEND_DIR)
-        result = subprocess.run(["pnpm", "install"], check=False)
+        result = _pnpm("install")
         if result.returncode != 0:
             print("Error: Failed to install frontend dependencies")
-            sys.exit(1)
+            return False
     
     # Build the frontend
     print("\nBuilding production bundle...")
-    os.chdir(FRONTEND_DIR)
-    result = subprocess.run(["pnpm", "run", "build"], check=False)
+    result = _pnpm("run", "build")
     
     if result.returncode != 0:
         print("Error: Frontend build failed")
-        sys.exit(1)
+        return False
     
     # Check if build was successful
-    dist_dir = FRONTEND_DIR / "dist"
-    if dist_dir.exists() and (dist_dir / "index.html").exists():
+    dist_dir = FRONTEND_INDEX.parent
+    if FRONTEND_INDEX.exists():
         print(f"\n[OK] Frontend build successful!")
         print(f"  Build output: {dist_dir}")
-        print(f"  Size: {sum(f.stat().st_size for f in dist_dir.rglob('*') if f.is_file()) / 1024:.2f} KB")
-    else:
-        print("Error: Build output not found")
+        print(f"  Size: {sum(_file_sizes(dist_dir)) / 1024:.2f} KB")
+        return True
+    
+    print("Error: Build output not found")
+    return False
+
+def main():
+    """Build the frontend application"""
+    if not build():
         sys.exit(1)
 
 if __name__ == "__main__":
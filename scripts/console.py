@@ -0,0 +1,21 @@
+"""
+Console Helper
+Rich console shared by the scripts, created on first use
+"""
+
+
+class LazyConsole:
+    """Proxy for rich.console.Console that defers importing rich until it is used"""
+    
+    def __init__(self):
+        self._console = None
+    
+    def __getattr__(self, name):
+        # Only reached for the Console API, _console itself is a normal attribute
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = LazyConsole()
@@ -3,34 +3,56 @@
 Development Server Script
 Runs both frontend and backend in development mode with hot reload
 """
-import os
-import sys
+import asyncio
+import shutil
 import subprocess
-import signal
+import sys
 from pathlib import Path
 
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
 BACKEND_DIR = PROJECT_ROOT / "backend"
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.server import loop_and_http
 
-def run_frontend():
-    """Run Vite development server"""
-    os.chdir(FRONTEND_DIR)
-    print("Starting frontend development server on http://localhost:5173")
-    subprocess.run(["pnpm", "run", "dev"], check=True)
+# Resolves pnpm.cmd on Windows, where exec cannot run the bare name
+PNPM = shutil.which("pnpm") or "pnpm"
 
-def run_backend():
-    """Run FastAPI development server"""
-    os.chdir(PROJECT_ROOT)
-    print("Starting backend development server on http://localhost:8000")
-    subprocess.run([
+def backend_command():
+    """Build the uvicorn command line for the backend dev server"""
+    cmd = [
         sys.executable, "-m", "uvicorn",
         "backend.main:app",
         "--reload",
         "--host", "0.0.0.0",
         "--port", "8000"
-    ], check=True)
+    ]
+    options = loop_and_http()
+    cmd.extend(["--loop", options["loop"], "--http", options["http"]])
+    return cmd
+
+async def run_servers():
+    """Run the Vite and FastAPI dev servers side by side until either exits"""
+    processes = {
+        "Frontend": await asyncio.create_subprocess_exec(PNPM, "run", "dev", cwd=FRONTEND_DIR),
+        "Backend": await asyncio.create_subprocess_exec(*backend_command(), cwd=PROJECT_ROOT),
+    }
+    waiters = {
+        asyncio.ensure_future(process.wait()): name
+        for name, process in processes.items()
+    }
+    try:
+        done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in done:
+            print(f"\n{waiters[waiter]} server exited with code {waiter.result()}")
+    finally:
+        # One server stopping (or Ctrl+C) takes the other down with it
+        for process in processes.values():
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*waiters)
 
 def main():
     """Main entry point"""
@@ -46,19 +68,13 @@ def main():
     # Check if frontend dependencies are installed
     if not (FRONTEND_DIR / "node_modules").exists():
         print("Frontend dependencies not found. Installing...")
-        os.chdir(FRONTEND_DIR)
-        subprocess.run(["pnpm", "install"], check=True)
-        os.chdir(PROJECT_ROOT)
+        subprocess.run([PNPM, "install"], check=True, cwd=FRONTEND_DIR)
     
-    # For simplicity, run backend only
-    # In production, you might want to use a process manager like concurrently
-    # or run them in separate terminals
     try:
-        run_backend()
+        asyncio.run(run_servers())
     except KeyboardInterrupt:
         print("\n\nShutting down development servers...")
         sys.exit(0)
 
 if __name__ == "__main__":
     main()
-
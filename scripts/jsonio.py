@@ -0,0 +1,25 @@
+"""
+JSON Helpers
+Read and write JSON with orjson when it is installed, stdlib json otherwise
+"""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def loads(data):
+    """Parse JSON from bytes, bytearray, memoryview or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps_pretty(obj) -> str:
+    """Serialize to JSON indented by two spaces, keeping non-ASCII characters"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
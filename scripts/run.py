@@ -5,46 +5,206 @@ Runs the application in the selected mode (Desktop or Web)
 """
 import os
 import sys
-import json
-import webbrowser
-import threading
+import mmap
+import pickle
+import socket
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from rich.console import Console
 
 # Add project root to Python path
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_ROOT_STR = str(PROJECT_ROOT)
+sys.path.insert(0, PROJECT_ROOT_STR)
+
+from scripts import jsonio
+from scripts.build_frontend import FRONTEND_INDEX, forkserver_context
+from scripts.console import console
 
 CONFIG_FILE = PROJECT_ROOT / "app_config.json"
-console = Console()
+BUILD_FRONTEND_SCRIPT = str(PROJECT_ROOT / "scripts" / "build_frontend.py")
+# Parsed config pickled with the (mtime_ns, size) of the JSON it came from
+CONFIG_CACHE_FILE = CONFIG_FILE.with_suffix(".cache.pkl")
+
+# Set once the frontend has been checked (and built if needed) in this process
+_frontend_checked = False
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """The parts of app_config.json the runner uses, parsed once"""
+    mode: str = "web"
+    name: str = "PyReact Fusion"
+    host: str = "0.0.0.0"
+    port: int = 8000
+    
+    @classmethod
+    def from_dict(cls, raw: dict) -> "AppConfig":
+        """Build from the decoded JSON, using defaults for anything missing"""
+        app_info = raw.get("app", {})
+        server = raw.get("server", {})
+        return cls(
+            mode=raw.get("mode", cls.mode),
+            name=app_info.get("name", cls.name),
+            host=server.get("host", cls.host),
+            port=server.get("port", cls.port)
+        )
 
 
-def load_config():
+def build_frontend_in_child() -> bool:
+    """
+    Build the frontend in a child process, returning whether it succeeded
+    Uses a forkserver with the common imports preloaded where the platform has one
+    """
+    ctx = forkserver_context()
+    if ctx is not None:
+        from scripts import build_frontend
+        process = ctx.Process(target=build_frontend.main)
+        process.start()
+        process.join()
+        return process.exitcode == 0
+    
+    # Windows has no forkserver, fall back to a fresh interpreter
+    import subprocess
+    build_result = subprocess.run(
+        [sys.executable, BUILD_FRONTEND_SCRIPT],
+        cwd=PROJECT_ROOT_STR,
+        capture_output=True
+    )
+    return build_result.returncode == 0
+
+
+def server_options() -> dict:
+    """uvicorn options naming the event loop and HTTP parser instead of autodetecting"""
+    from backend.server import loop_and_http
+    
+    return {**loop_and_http(), "interface": "asgi3"}
+
+
+def _frontend_ready() -> bool:
+    """Check for the built index.html with a single stat"""
+    try:
+        os.stat(FRONTEND_INDEX)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def ensure_frontend_built():
+    """Build the frontend if needed; only the first call per process checks"""
+    global _frontend_checked
+    if _frontend_checked:
+        return
+    
+    if not _frontend_ready():
+        console.print("[yellow]Frontend not built. Building now...[/yellow]")
+        if not build_frontend_in_child():
+            console.print("[red]Frontend build failed![/red]")
+            console.print("[yellow]Please build frontend manually: python scripts/build_frontend.py[/yellow]")
+        else:
+            console.print("[green]✓ Frontend built successfully[/green]")
+    
+    _frontend_checked = True
+
+
+def open_url(url: str) -> None:
+    """Open url in the default browser through the platform's own launcher"""
+    if os.name == "nt":
+        os.startfile(url)
+        return
+    
+    import subprocess
+    if sys.platform == "darwin":
+        subprocess.Popen(["open", url])
+        return
+    
+    try:
+        subprocess.Popen(
+            ["xdg-open", url],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except FileNotFoundError:
+        # No xdg-utils (minimal installs); let webbrowser search for a browser
+        import webbrowser
+        webbrowser.open(url)
+
+
+def wait_for_server(host: str, port: int, timeout: float = 10.0) -> bool:
+    """Wait until the server accepts connections instead of sleeping a fixed time"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.01)
+    return False
+
+
+def load_config() -> AppConfig:
     """Load application configuration"""
-    if not CONFIG_FILE.exists():
+    # read_config_file's stat doubles as the existence check
+    try:
+        return AppConfig.from_dict(read_config_file())
+    except FileNotFoundError:
         console.print("[yellow]Configuration file not found![/yellow]")
         console.print("[cyan]Running initial setup...[/cyan]\n")
-        
-        # Run setup automatically using subprocess
-        import subprocess
-        import sys
-        subprocess.run([sys.executable, str(PROJECT_ROOT / "scripts" / "setup.py")])
-        
-        # Reload config after setup
-        if not CONFIG_FILE.exists():
-            console.print("[red]Setup failed. Please run setup manually:[/red]")
-            console.print("[cyan]  python scripts/setup.py[/cyan]\n")
-            sys.exit(1)
     
-    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Run setup in this interpreter; we launch the app ourselves afterwards
+    from scripts import setup as _setup
+    _setup.main(auto_launch=False)
+    
+    # Reload config after setup
+    try:
+        return AppConfig.from_dict(read_config_file())
+    except FileNotFoundError:
+        console.print("[red]Setup failed. Please run setup manually:[/red]")
+        console.print("[cyan]  python scripts/setup.py[/cyan]\n")
+        sys.exit(1)
+
+
+def read_config_file():
+    """Read the configuration, reusing the pickled copy while the JSON is unchanged"""
+    stat_result = CONFIG_FILE.stat()
+    key = (stat_result.st_mtime_ns, stat_result.st_size)
+    
+    try:
+        with open(CONFIG_CACHE_FILE, "rb") as f:
+            cached_key, config = pickle.load(f)
+        if cached_key == key:
+            return config
+    except Exception:
+        pass  # missing or unreadable cache, fall back to the JSON
+    
+    with open(CONFIG_FILE, "rb") as f:
+        if stat_result.st_size:
+            # Parse straight from the mapped pages, no read() copy or text decode
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                config = jsonio.loads(view)
+        else:
+            # Empty files cannot be mapped; let the parser report them
+            config = jsonio.loads(f.read())
+    
+    # Write atomically so a concurrent reader never sees a partial pickle
+    try:
+        tmp_file = CONFIG_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, CONFIG_CACHE_FILE)
+    except OSError:
+        pass  # the cache is only an optimization
+    
+    return config
 
 
 def run_web_mode(config):
     """Run application in web mode (browser)"""
-    server = config.get("server", {})
-    host = server.get("host", "0.0.0.0")
-    port = server.get("port", 8000)
+    import asyncio
+    
+    host = config.host
+    port = config.port
     
     # For browser access, use localhost (0.0.0.0 is for binding only)
     browser_url = f"http://localhost:{port}"
@@ -52,25 +212,7 @@ def run_web_mode(config):
     console.print(f"[green]Starting server on {host}:{port}...[/green]")
     console.print(f"[green]Access at: {browser_url}[/green]")
     
-    # Ensure project root is in path
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-    
-    # Check if frontend is built
-    frontend_dist = PROJECT_ROOT / "frontend" / "dist"
-    if not frontend_dist.exists() or not (frontend_dist / "index.html").exists():
-        console.print("[yellow]Frontend not built. Building now...[/yellow]")
-        import subprocess
-        build_result = subprocess.run(
-            [sys.executable, str(PROJECT_ROOT / "scripts" / "build_frontend.py")],
-            cwd=str(PROJECT_ROOT),
-            capture_output=True
-        )
-        if build_result.returncode != 0:
-            console.print("[red]Frontend build failed![/red]")
-            console.print("[yellow]Please build frontend manually: python scripts/build_frontend.py[/yellow]")
-        else:
-            console.print("[green]✓ Frontend built successfully[/green]")
+    ensure_frontend_built()
     
     # Start the server
     import uvicorn
@@ -80,31 +222,43 @@ def run_web_mode(config):
     settings.host = host
     settings.port = port
     
-    # Open browser after a short delay
-    def open_browser():
-        import time
-        time.sleep(2)
+    from backend.main import app
+    server = uvicorn.Server(uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        **server_options()
+    ))
+    
+    # Open browser from the server's own loop as soon as it is listening
+    async def open_browser():
+        while not server.started:
+            await asyncio.sleep(0.01)
         try:
-            webbrowser.open(browser_url)
+            open_url(browser_url)
             console.print(f"[green]✓ Browser opened at {browser_url}[/green]\n")
         except Exception as e:
             console.print(f"[yellow]Could not open browser automatically: {e}[/yellow]")
             console.print(f"[cyan]Please open manually: {browser_url}[/cyan]\n")
     
-    threading.Thread(target=open_browser, daemon=True).start()
+    async def serve():
+        opener = asyncio.create_task(open_browser())
+        try:
+            await server.serve()
+        finally:
+            # Startup may have failed before the browser was opened
+            opener.cancel()
     
-    # Run server
-    from backend.main import app
-    uvicorn.run(
-        app,
-        host=host,
-        port=port,
-        log_level="info"
-    )
+    # Run server (what Server.run does, plus the browser task)
+    server.config.setup_event_loop()
+    asyncio.run(serve())
 
 
 def run_desktop_mode(config):
     """Run application in desktop mode (pywebview)"""
+    import threading
+    
     try:
         import webview
     except ImportError:
@@ -113,62 +267,45 @@ def run_desktop_mode(config):
         console.print("[cyan]  pip install pywebview[/cyan]\n")
         sys.exit(1)
     
-    server = config.get("server", {})
     # For desktop mode, always use 127.0.0.1 (pywebview needs specific IP)
     # Server binds to 127.0.0.1, URL also uses 127.0.0.1
     bind_host = "127.0.0.1"
-    port = server.get("port", 8000)
+    port = config.port
     
     url = f"http://127.0.0.1:{port}"
-    app_name = config.get("app", {}).get("name", "PyReact Fusion")
+    app_name = config.name
     
     console.print(f"[green]Starting server on {url}...[/green]")
     console.print(f"[green]Opening desktop window: {app_name}[/green]")
     console.print("[dim]Close the window to stop the application[/dim]\n")
     
-    # Check if frontend is built
-    frontend_dist = PROJECT_ROOT / "frontend" / "dist"
-    if not frontend_dist.exists() or not (frontend_dist / "index.html").exists():
-        console.print("[yellow]Frontend not built. Building now...[/yellow]")
-        import subprocess
-        build_result = subprocess.run(
-            [sys.executable, str(PROJECT_ROOT / "scripts" / "build_frontend.py")],
-            cwd=str(PROJECT_ROOT),
-            capture_output=True
-        )
-        if build_result.returncode != 0:
-            console.print("[red]Frontend build failed![/red]")
-            console.print("[yellow]Please build frontend manually: python scripts/build_frontend.py[/yellow]")
-        else:
-            console.print("[green]✓ Frontend built successfully[/green]")
+    ensure_frontend_built()
     
-    # Start server in background thread
-    def start_server():
-        # Ensure project root is in path
-        if str(PROJECT_ROOT) not in sys.path:
-            sys.path.insert(0, str(PROJECT_ROOT))
-        
-        import uvicorn
-        from backend.config import settings
-        
-        # Use 127.0.0.1 for desktop mode (pywebview requirement)
-        settings.host = bind_host
-        settings.port = port
-        
-        from backend.main import app
-        uvicorn.run(
-            app,
-            host=bind_host,
-            port=port,
-            log_level="warning"  # Reduce console output
-        )
+    # Import the app here, once, rather than inside the server thread
+    import uvicorn
+    from backend.config import settings
     
-    server_thread = threading.Thread(target=start_server, daemon=True)
+    # Use 127.0.0.1 for desktop mode (pywebview requirement)
+    settings.host = bind_host
+    settings.port = port
+    
+    from backend.main import app
+    
+    # Start server in background thread
+    server = uvicorn.Server(uvicorn.Config(
+        app,
+        host=bind_host,
+        port=port,
+        log_level="warning",  # Reduce console output
+        access_log=False,  # Local-only window, nobody reads these
+        **server_options()
+    ))
+    server_thread = threading.Thread(target=server.run, daemon=True)
     server_thread.start()
     
-    # Wait a bit for server to start
-    import time
-    time.sleep(2)
+    # Wait for the server to start listening
+    if not wait_for_server(bind_host, port):
+        console.print("[yellow]Server is taking longer than expected to start[/yellow]")
     
     # Create and show window
     try:
@@ -185,6 +322,9 @@ def run_desktop_mode(config):
     except Exception as e:
         console.print(f"[red]Error creating desktop window: {e}[/red]")
         console.print("[yellow]Falling back to web mode...[/yellow]\n")
+        # Release the port before web mode binds it again
+        server.should_exit = True
+        server_thread.join()
         run_web_mode(config)
 
 
@@ -196,18 +336,12 @@ def main():
     config = load_config()
     
     # Display configuration info
-    app_info = config.get("app", {})
-    app_name = app_info.get("name", "PyReact Fusion")
-    mode = config.get("mode", "web")
-    server = config.get("server", {})
-    port = server.get("port", 8000)
-    
-    console.print(f"[green]App:[/green] {app_name}")
-    console.print(f"[green]Mode:[/green] {mode.title()}")
-    console.print(f"[green]Port:[/green] {port}\n")
+    console.print(f"[green]App:[/green] {config.name}")
+    console.print(f"[green]Mode:[/green] {config.mode.title()}")
+    console.print(f"[green]Port:[/green] {config.port}\n")
     
     # Run in selected mode
-    if mode == "desktop":
+    if config.mode == "desktop":
         run_desktop_mode(config)
     else:
         run_web_mode(config)
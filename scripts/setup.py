@@ -5,26 +5,23 @@ Interactive setup for PyReact Fusion application
 """
 import os
 import sys
-import json
 from pathlib import Path
 
 # Add project root to Python path
-PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.text import Text
-from rich import box
-
-console = Console()
+from scripts import jsonio
+from scripts.console import console
 
 CONFIG_FILE = PROJECT_ROOT / "app_config.json"
 
 
 def print_header():
     """Print welcome header"""
+    from rich import box
+    from rich.panel import Panel
+    
     console.print("\n")
     console.print(Panel.fit(
         "[bold cyan]PyReact Fusion[/bold cyan] - Application Setup",
@@ -36,6 +33,8 @@ def print_header():
 
 def get_app_mode():
     """Get application mode (Desktop or Web)"""
+    from rich.prompt import Prompt
+    
     console.print("[bold yellow]Step 1: Choose Application Mode[/bold yellow]\n")
     console.print("How would you like to run your application?")
     console.print("  [cyan]1.[/cyan] Desktop Mode - Runs in a native desktop window (pywebview)")
@@ -56,6 +55,8 @@ def get_app_mode():
 
 def get_app_info():
     """Collect application information"""
+    from rich.prompt import Prompt
+    
     console.print("\n[bold yellow]Step 2: Application Information[/bold yellow]\n")
     
     app_name = Prompt.ask(
@@ -102,6 +103,8 @@ def get_app_info():
 
 def get_database_config():
     """Get database configuration"""
+    from rich.prompt import Prompt
+    
     console.print("\n[bold yellow]Step 3: Database Configuration[/bold yellow]\n")
     console.print("Which database would you like to use?")
     console.print("  [cyan]1.[/cyan] SQLite (Default - No setup required)")
@@ -127,6 +130,8 @@ def get_database_config():
 
 def get_server_config():
     """Get server configuration"""
+    from rich.prompt import Prompt
+    
     console.print("\n[bold yellow]Step 4: Server Configuration[/bold yellow]\n")
     
     host = Prompt.ask(
@@ -149,7 +154,7 @@ def save_config(config):
     """Save configuration to file"""
     try:
         with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            f.write(jsonio.dumps_pretty(config))
         console.print(f"\n[green]✓ Configuration saved to {CONFIG_FILE}[/green]")
         return True
     except Exception as e:
@@ -157,8 +162,21 @@ def save_config(config):
         return False
 
 
-def main():
-    """Main setup function"""
+def main(auto_launch: bool = True):
+    """
+    Main setup function
+    auto_launch=False skips the offer to start the app, for callers that run it themselves
+    """
+    from rich import box
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    from scripts.build_frontend import FRONTEND_INDEX, forkserver_context
+    
+    # A missing frontend means the run that follows will build it; start the
+    # forkserver now so its imports load while the user answers prompts
+    if not FRONTEND_INDEX.exists():
+        forkserver_context()
+    
     print_header()
     
     # Check if config already exists
@@ -168,8 +186,8 @@ def main():
         
         # Show current config
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                current_config = json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                current_config = jsonio.loads(f.read())
                 app_info = current_config.get("app", {})
                 mode = current_config.get("mode", "web")
                 console.print(f"  Mode: {mode.title()}")
@@ -218,6 +236,9 @@ def main():
         console.print("\n[yellow]Configuration saved![/yellow]")
         console.print("[dim]This configuration will be used automatically on next run.[/dim]\n")
         
+        if not auto_launch:
+            return
+        
         run_now = Confirm.ask(
             "[cyan]Would you like to run the application now?[/cyan]",
             default=True
@@ -225,10 +246,9 @@ def main():
         
         if run_now:
             console.print("\n[green]Starting application...[/green]\n")
-            # Import run script using subprocess to avoid import issues
-            import subprocess
-            import sys
-            subprocess.run([sys.executable, str(PROJECT_ROOT / "scripts" / "run.py")])
+            # Run in this interpreter instead of paying for a second startup
+            from scripts import run as _run
+            _run.main()
         else:
             console.print("\n[yellow]You can run your application later with:[/yellow]")
             console.print("[cyan]  python scripts/run.py[/cyan]\n")
@@ -1,13 +1,28 @@
 """
 PyReact Fusion Template - Setup Configuration
 """
+import sys
+from pathlib import Path
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+HERE = Path(__file__).parent
+
+# Option-only invocations (python setup.py --version, --name, ...) just print
+# metadata, so they skip reading the README and requirements
+_ARGS = sys.argv[1:]
+_METADATA_QUERY = bool(_ARGS) and all(arg.startswith("-") for arg in _ARGS)
+
+
+def _read_long_description():
+    """Read the README used as the package's long description"""
+    return (HERE / "README.md").read_text(encoding="utf-8")
+
+
+def _load_requirements():
+    """Read install requirements, skipping blank lines and comments"""
+    with open(HERE / "requirements.txt", "r", encoding="utf-8") as fh:
+        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
 setup(
     name="pyreact-fusion",
@@ -15,7 +30,10 @@ setup(
     author="Sofiane Khoudour",
     author_email="khoudoursofiane75@gmail.com",
     description="A production-ready full-stack application template with Python FastAPI backend and React frontend",
-    long_description=long_description,
+    long_description=(
+        "" if _METADATA_QUERY and "--long-description" not in _ARGS
+        else _read_long_description()
+    ),
     long_description_content_type="text/markdown",
     url="https://github.com/skmercur/pyreact-fusion",
     packages=find_packages(),
@@ -30,7 +48,7 @@ setup(
         "Programming Language :: Python :: 3.12",
     ],
     python_requires=">=3.9",
-    install_requires=requirements,
+    install_requires=[] if _METADATA_QUERY else _load_requirements(),
     entry_points={
         "console_scripts": [
             "pyreact-fusion=backend.main:main",